@@ -239,6 +239,9 @@ class PqosApi:
             log.error(str(ex))
             return -1
 
+        # Reset changes CDP/MBA CTRL state, drop cached capabilities
+        self.cap.refresh()
+
         # Reread MBA BW status from libpqos
         if mba_cfg != "any":
             self.refresh_mba_bw_status()
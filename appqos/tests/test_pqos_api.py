@@ -334,10 +334,13 @@ class TestPqosApi(object):
         # All OK!
         assert 0 == self.Pqos_api.enable_mba_bw(enabled_mba_bw)
         self.Pqos_api.alloc.reset.assert_called_once_with("any", "any", "ctrl" if enabled_mba_bw else "default")
+        self.Pqos_api.cap.refresh.assert_called_once()
 
         # Alloc Reset fails
         self.Pqos_api.alloc.reset.side_effect = Exception("test")
         assert -1 == self.Pqos_api.enable_mba_bw(enabled_mba_bw)
+        # capability caches are not dropped when reset fails
+        self.Pqos_api.cap.refresh.assert_called_once()
 
 
     def test_is_l2_cat_supported(self):
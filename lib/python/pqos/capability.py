@@ -36,26 +36,141 @@ The module defines PqosCap which can be used to read PQoS capabilities.
 
 from __future__ import absolute_import, division, print_function
 import ctypes
+import struct
+
+from collections import namedtuple
+from operator import attrgetter
 
 from pqos.common import pqos_handle_error
 from pqos.pqos import Pqos
-from pqos.native_struct import CPqosCap, CPqosCapability, CPqosMonitor
+from pqos.native_struct import (
+    CPqosCap, CPqosCapability, CPqosCapabilityL3, CPqosCapabilityMBA,
+    CPqosMonitor)
+
+# Pointer types constructed once instead of on every call
+_CPqosCapP = ctypes.POINTER(CPqosCap)
+_CPqosCapabilityP = ctypes.POINTER(CPqosCapability)
+
+# struct module format characters for ctypes scalars used in
+# the capability structures
+_CTYPE_FMT_MAP = {
+    ctypes.c_uint: 'I',
+    ctypes.c_int: 'i',
+    ctypes.c_uint64: 'Q',
+}
+
+
+def _build_struct_fmt(ctype):
+    """
+    Builds a struct module format string matching the memory layout of
+    a ctypes Structure, padding between fields included. Zero-size
+    fields (flexible array members) are skipped.
+    """
+    fmt = '='
+    offset = 0
+
+    # _fields_ is documented public ctypes API despite the underscore
+    for name, field_type in ctype._fields_:  # pylint: disable=protected-access
+        field = getattr(ctype, name)
+
+        if field.size == 0:
+            continue
+
+        fmt += 'x' * (field.offset - offset)
+        fmt += _CTYPE_FMT_MAP[field_type]
+        offset = field.offset + field.size
+
+    return fmt
+
+
+def _make_marshaller(ctype):
+    """
+    Compiles a reader for a ctypes Structure type from its _fields_.
+    The returned function takes a structure instance and returns
+    the values of all fixed-size fields in declaration order, read from
+    the raw buffer in a single precompiled struct call instead of
+    per-field ctypes attribute access.
+    """
+    parser = struct.Struct(_build_struct_fmt(ctype))
+    unpack_from = parser.unpack_from
+    from_address = (ctypes.c_char * parser.size).from_address
+    addressof = ctypes.addressof
+
+    def marshal(c_obj):
+        "Reads all fixed-size structure fields in one call."
+        return unpack_from(from_address(addressof(c_obj)))
+
+    return marshal
+
+
+# Marshallers compiled once at import; CPqosCapabilityL2 shares
+# the layout of CPqosCapabilityL3
+_parse_ca = _make_marshaller(CPqosCapabilityL3)
+_parse_mba = _make_marshaller(CPqosCapabilityMBA)
+
+# Result of is_*_enabled() queries, unpacks like a plain 2-tuple
+CdpStatus = namedtuple('CdpStatus', ['supported', 'enabled'])
+
+# Batched field reader for the monitoring capability structure, one
+# attrgetter call in C instead of an attribute read per field
+_MON_GET = attrgetter('mem_size', 'max_rmid', 'l3_size', 'num_events',
+                      'events')
 
 class PqosCapabilityMonitoring(object):
     "PQoS monitoring capability"
     # pylint: disable=too-few-public-methods
 
+    __slots__ = ('mem_size', 'max_rmid', 'l3_size', '_events', '_events_ptr',
+                 '_num_events')
+
     def __init__(self):
-        self.mem_size = 0    # byte size of the structure
-        self.max_rmid = 0    # max RMID supported by socket
-        self.l3_size = 0     # L3 cache size in bytes
-        self.events = []     # a list of supported events
+        self.mem_size = 0       # byte size of the structure
+        self.max_rmid = 0       # max RMID supported by socket
+        self.l3_size = 0        # L3 cache size in bytes
+        self._events_ptr = None # raw pointer to the events array
+        self._num_events = 0    # number of supported events
+        self.events = []        # a list of supported events
+
+    @classmethod
+    def from_c(cls, c_capability):
+        """
+        Builds PqosCapabilityMonitoring object directly from its low-level
+        counterpart, skipping default initialization. The event list is
+        materialized lazily on first access to the events attribute.
+        """
+        self = cls.__new__(cls)
+        (self.mem_size, self.max_rmid, self.l3_size, self._num_events,
+         self._events_ptr) = _MON_GET(c_capability)
+        self._events = None
+        return self
+
+    @property
+    def events(self):
+        "A list of supported events"
+
+        events = self._events
+
+        if events is None:
+            events_arr = ctypes.cast(
+                self._events_ptr,
+                ctypes.POINTER(CPqosMonitor * self._num_events)).contents
+            events = list(events_arr)
+            self._events = events
+
+        return events
+
+    @events.setter
+    def events(self, value):
+        self._events = value
 
 
 class PqosCapabilityL3Ca(object):
     "PQoS L3 cache allocation capability"
     # pylint: disable=too-few-public-methods,too-many-instance-attributes
 
+    __slots__ = ('mem_size', 'num_classes', 'num_ways', 'way_size',
+                 'way_contention', 'cdp', 'cdp_on', 'non_contiguous_cbm')
+
     def __init__(self):
         self.mem_size = 0               # byte size of the structure
         self.num_classes = 0            # number of classes of service
@@ -66,11 +181,22 @@ class PqosCapabilityL3Ca(object):
         self.cdp_on = False             # code data prioritization on or off
         self.non_contiguous_cbm = False # Non-Contiguous CBM support
 
+    @classmethod
+    def from_c(cls, c_capability):
+        """
+        Builds PqosCapabilityL3Ca object directly from its low-level
+        counterpart, skipping default initialization.
+        """
+        return _fill_ca(c_capability, cls.__new__(cls))
+
 
 class PqosCapabilityL2Ca(object):
     "PQoS L2 cache allocation capability"
     # pylint: disable=too-few-public-methods,too-many-instance-attributes
 
+    __slots__ = ('mem_size', 'num_classes', 'num_ways', 'way_size',
+                 'way_contention', 'cdp', 'cdp_on', 'non_contiguous_cbm')
+
     def __init__(self):
         self.mem_size = 0               # byte size of the structure
         self.num_classes = 0            # number of classes of service
@@ -81,11 +207,22 @@ class PqosCapabilityL2Ca(object):
         self.cdp_on = False             # code data prioritization on or off
         self.non_contiguous_cbm = False # Non-Contiguous CBM support
 
+    @classmethod
+    def from_c(cls, c_capability):
+        """
+        Builds PqosCapabilityL2Ca object directly from its low-level
+        counterpart, skipping default initialization.
+        """
+        return _fill_ca(c_capability, cls.__new__(cls))
+
 
 class PqosCapabilityMba(object):
     "PQoS memory bandwidth allocation capability"
     # pylint: disable=too-few-public-methods
 
+    __slots__ = ('mem_size', 'num_classes', 'throttle_max', 'throttle_step',
+                 'is_linear', 'ctrl', 'ctrl_on')
+
     def __init__(self):
         self.mem_size = 0              # byte size of the structure
         self.num_classes = 0           # number of classes of service
@@ -95,16 +232,27 @@ class PqosCapabilityMba(object):
         self.ctrl = False              # MBA controller support
         self.ctrl_on = False           # MBA controller on or off
 
+    @classmethod
+    def from_c(cls, c_capability):
+        """
+        Builds PqosCapabilityMba object directly from its low-level
+        counterpart, skipping default initialization.
+        """
+        self = cls.__new__(cls)
+        (self.mem_size, self.num_classes, self.throttle_max,
+         self.throttle_step, is_linear, ctrl, ctrl_on) = \
+            _parse_mba(c_capability)
+        self.is_linear = is_linear == 1
+        tristate = _get_tristate_bool
+        self.ctrl = tristate(ctrl)
+        self.ctrl_on = tristate(ctrl_on)
+        return self
+
 
 def _get_tristate_bool(c_val):
     "Converts tri-state integer value -1, 0 or 1 to None, False or True."
-    tristate_map = {
-        1: True,
-        0: False,
-        -1: None
-    }
 
-    return tristate_map.get(c_val)
+    return True if c_val == 1 else False if c_val == 0 else None
 
 
 def _get_cap_mon(p_capability):
@@ -112,17 +260,20 @@ def _get_cap_mon(p_capability):
     Converts low-level pqos_cap_mon structure to
     high-level PqosCapabilityMonitoring object.
     """
-    c_capability = p_capability.contents
-    capability = PqosCapabilityMonitoring()
-    capability.mem_size = c_capability.mem_size
-    capability.max_rmid = c_capability.max_rmid
-    capability.l3_size = c_capability.l3_size
+    return PqosCapabilityMonitoring.from_c(p_capability.contents)
 
-    events_ptr = ctypes.cast(c_capability.events, ctypes.POINTER(CPqosMonitor))
-
-    for i in range(c_capability.num_events):
-        capability.events.append(events_ptr[i])
 
+def _fill_ca(c_capability, capability):
+    """
+    Copies fields shared by pqos_cap_l3ca and pqos_cap_l2ca structures to
+    a high-level cache allocation capability object.
+    """
+    (capability.mem_size, capability.num_classes, capability.num_ways,
+     capability.way_size, capability.way_contention, cdp, cdp_on,
+     capability.non_contiguous_cbm) = _parse_ca(c_capability)
+    tristate = _get_tristate_bool
+    capability.cdp = tristate(cdp)
+    capability.cdp_on = tristate(cdp_on)
     return capability
 
 
@@ -131,17 +282,7 @@ def _get_cap_l3ca(p_capability):
     Converts low-level pqos_cap_l3ca structure to
     high-level PqosCapabilityL3Ca object.
     """
-    c_capability = p_capability.contents
-    capability = PqosCapabilityL3Ca()
-    capability.mem_size = c_capability.mem_size
-    capability.num_classes = c_capability.num_classes
-    capability.num_ways = c_capability.num_ways
-    capability.way_size = c_capability.way_size
-    capability.way_contention = c_capability.way_contention
-    capability.cdp = _get_tristate_bool(c_capability.cdp)
-    capability.cdp_on = _get_tristate_bool(c_capability.cdp_on)
-    capability.non_contiguous_cbm = c_capability.non_contiguous_cbm
-    return capability
+    return PqosCapabilityL3Ca.from_c(p_capability.contents)
 
 
 def _get_cap_l2ca(p_capability):
@@ -149,17 +290,7 @@ def _get_cap_l2ca(p_capability):
     Converts low-level pqos_cap_l2ca structure to
     high-level PqosCapabilityL2Ca object.
     """
-    c_capability = p_capability.contents
-    capability = PqosCapabilityL2Ca()
-    capability.mem_size = c_capability.mem_size
-    capability.num_classes = c_capability.num_classes
-    capability.num_ways = c_capability.num_ways
-    capability.way_size = c_capability.way_size
-    capability.way_contention = c_capability.way_contention
-    capability.cdp = _get_tristate_bool(c_capability.cdp)
-    capability.cdp_on = _get_tristate_bool(c_capability.cdp_on)
-    capability.non_contiguous_cbm = c_capability.non_contiguous_cbm
-    return capability
+    return PqosCapabilityL2Ca.from_c(p_capability.contents)
 
 
 def _get_cap_mba(p_capability):
@@ -167,57 +298,131 @@ def _get_cap_mba(p_capability):
     Converts low-level pqos_cap_mba structure to
     high-level PqosCapabilityMba object.
     """
-    c_capability = p_capability.contents
-    capability = PqosCapabilityMba()
-    capability.mem_size = c_capability.mem_size
-    capability.num_classes = c_capability.num_classes
-    capability.throttle_max = c_capability.throttle_max
-    capability.throttle_step = c_capability.throttle_step
-    capability.is_linear = c_capability.is_linear == 1
-    capability.ctrl = _get_tristate_bool(c_capability.ctrl)
-    capability.ctrl_on = _get_tristate_bool(c_capability.ctrl_on)
-    return capability
+    return PqosCapabilityMba.from_c(p_capability.contents)
+
+
+_TYPE_ENUM_MAP = {
+    'mon': CPqosCapability.PQOS_CAP_TYPE_MON,
+    'l3ca': CPqosCapability.PQOS_CAP_TYPE_L3CA,
+    'l2ca': CPqosCapability.PQOS_CAP_TYPE_L2CA,
+    'mba': CPqosCapability.PQOS_CAP_TYPE_MBA
+}
+
+_TYPE_CAP_MAP = {
+    'mon': (_get_cap_mon, attrgetter('u.mon')),
+    'l3ca': (_get_cap_l3ca, attrgetter('u.l3ca')),
+    'l2ca': (_get_cap_l2ca, attrgetter('u.l2ca')),
+    'mba': (_get_cap_mba, attrgetter('u.mba'))
+}
 
 
 def pqos_get_type_enum(type_str):
     "Converts capability type string to pqos_capability's enum."
-    type_enum_map = {
-        'mon': CPqosCapability.PQOS_CAP_TYPE_MON,
-        'l3ca': CPqosCapability.PQOS_CAP_TYPE_L3CA,
-        'l2ca': CPqosCapability.PQOS_CAP_TYPE_L2CA,
-        'mba': CPqosCapability.PQOS_CAP_TYPE_MBA
-    }
 
-    return type_enum_map[type_str.lower()]
+    type_enum = _TYPE_ENUM_MAP.get(type_str)
+
+    if type_enum is not None:
+        return type_enum
+
+    return _TYPE_ENUM_MAP[type_str.lower()]
 
 
 def _get_capability(cap_item, type_str):
     "Converts capability type string to pqos_capability's enum."
-    type_cls_map = {
-        'mon': (_get_cap_mon, lambda c: c.u.mon),
-        'l3ca': (_get_cap_l3ca, lambda c: c.u.l3ca),
-        'l2ca': (_get_cap_l2ca, lambda c: c.u.l2ca),
-        'mba': (_get_cap_mba, lambda c: c.u.mba)
-    }
-    capability_func, cap_item_func = type_cls_map[type_str.lower()]
+
+    cap_entry = _TYPE_CAP_MAP.get(type_str)
+
+    if cap_entry is None:
+        cap_entry = _TYPE_CAP_MAP[type_str.lower()]
+
+    capability_func, cap_item_func = cap_entry
     return capability_func(cap_item_func(cap_item))
 
 
 class PqosCap(object):
     "PQoS capabilities"
+    # pylint: disable=too-many-instance-attributes
 
     def __init__(self):
         "Initializes capabilities, calls pqos_cap_get."
 
         self.pqos = Pqos()
-        self.p_cap = ctypes.POINTER(CPqosCap)()
-        ret = self.pqos.lib.pqos_cap_get(ctypes.byref(self.p_cap), None)
+        self.p_cap = _CPqosCapP()
+
+        # Reusable ctypes output arguments, preallocated once to avoid
+        # constructing new ctypes objects on every API call
+        self._cos_num = ctypes.c_uint(0)
+        self._supported = ctypes.c_int(0)
+        self._enabled = ctypes.c_int(0)
+        self._p_cap_item = _CPqosCapabilityP()
+        self._p_cap_item_ref = ctypes.byref(self._p_cap_item)
+
+        # Function handles resolved once so that hot-path calls skip
+        # the CDLL attribute lookup, with argtypes/restype declared so
+        # ctypes can use its fast argument conversion path
+        lib = self.pqos.lib
+        self._pqos_cap_get_type = lib.pqos_cap_get_type
+        self._pqos_cap_get_type.argtypes = [
+            _CPqosCapP, ctypes.c_int, ctypes.POINTER(_CPqosCapabilityP)
+        ]
+        self._pqos_cap_get_type.restype = ctypes.c_int
+
+        cos_num_argtypes = [_CPqosCapP, ctypes.POINTER(ctypes.c_uint)]
+        self._pqos_l3ca_get_cos_num = lib.pqos_l3ca_get_cos_num
+        self._pqos_l3ca_get_cos_num.argtypes = cos_num_argtypes
+        self._pqos_l3ca_get_cos_num.restype = ctypes.c_int
+        self._pqos_l2ca_get_cos_num = lib.pqos_l2ca_get_cos_num
+        self._pqos_l2ca_get_cos_num.argtypes = cos_num_argtypes
+        self._pqos_l2ca_get_cos_num.restype = ctypes.c_int
+        self._pqos_mba_get_cos_num = lib.pqos_mba_get_cos_num
+        self._pqos_mba_get_cos_num.argtypes = cos_num_argtypes
+        self._pqos_mba_get_cos_num.restype = ctypes.c_int
+
+        enabled_argtypes = [_CPqosCapP, ctypes.POINTER(ctypes.c_int),
+                            ctypes.POINTER(ctypes.c_int)]
+        self._pqos_l3ca_cdp_enabled = lib.pqos_l3ca_cdp_enabled
+        self._pqos_l3ca_cdp_enabled.argtypes = enabled_argtypes
+        self._pqos_l3ca_cdp_enabled.restype = ctypes.c_int
+        self._pqos_l2ca_cdp_enabled = lib.pqos_l2ca_cdp_enabled
+        self._pqos_l2ca_cdp_enabled.argtypes = enabled_argtypes
+        self._pqos_l2ca_cdp_enabled.restype = ctypes.c_int
+        self._pqos_mba_ctrl_enabled = lib.pqos_mba_ctrl_enabled
+        self._pqos_mba_ctrl_enabled.argtypes = enabled_argtypes
+        self._pqos_mba_ctrl_enabled.restype = ctypes.c_int
+
+        # Capability query results, filled in lazily and served without
+        # another native call until refresh() is called
+        self._cap_cache = {}
+        self._cos_num_cache = {}
+        self._status_cache = {}
+
+        pqos_cap_get = lib.pqos_cap_get
+        pqos_cap_get.argtypes = [ctypes.POINTER(_CPqosCapP), ctypes.c_void_p]
+        pqos_cap_get.restype = ctypes.c_int
+        ret = pqos_cap_get(ctypes.byref(self.p_cap), None)
         pqos_handle_error('pqos_cap_get', ret)
 
+    def refresh(self):
+        """
+        Clears cached results of capability queries.
+
+        Query results are cached and returned without calling PQoS library
+        again. Some of them change when CDP or MBA CTRL is reconfigured,
+        so this method has to be called after resetting the allocation
+        configuration.
+        """
+
+        self._cap_cache.clear()
+        self._cos_num_cache.clear()
+        self._status_cache.clear()
+
     def get_type(self, type_str):
         """
         Retrieves a type of capability from a cap structure.
 
+        The result is cached: it can go stale when the allocation
+        configuration is reset, call refresh() to force a new query.
+
         Parameters:
             type_str: a string indicating a type of capability, available
                       options: mon, l3ca, l2ca and mba
@@ -226,14 +431,20 @@ class PqosCap(object):
             capabilities
         """
 
-        type_enum = pqos_get_type_enum(type_str)
-        p_cap_item = ctypes.POINTER(CPqosCapability)()
-        ret = self.pqos.lib.pqos_cap_get_type(self.p_cap, type_enum,
-                                              ctypes.byref(p_cap_item))
+        key = type_str if type_str in _TYPE_CAP_MAP else type_str.lower()
+        capability = self._cap_cache.get(key)
+
+        if capability is not None:
+            return capability
+
+        type_enum = pqos_get_type_enum(key)
+        ret = self._pqos_cap_get_type(self.p_cap, type_enum,
+                                      self._p_cap_item_ref)
         pqos_handle_error('pqos_cap_get_type', ret)
 
-        cap_item = p_cap_item.contents
-        capability = _get_capability(cap_item, type_str)
+        cap_item = self._p_cap_item.contents
+        capability = _get_capability(cap_item, key)
+        self._cap_cache[key] = capability
         return capability
 
     def get_l3ca_cos_num(self):
@@ -241,14 +452,24 @@ class PqosCap(object):
         Retrieves number of L3 allocation classes of service from
         a cap structure.
 
+        The result is cached: it can go stale when the allocation
+        configuration is reset, call refresh() to force a new query.
+
         Returns:
             a number of L3 allocation classes
         """
 
-        cos_num = ctypes.c_uint(0)
-        ret = self.pqos.lib.pqos_l3ca_get_cos_num(self.p_cap,
-                                                  ctypes.byref(cos_num))
+        cached = self._cos_num_cache.get('l3ca')
+
+        if cached is not None:
+            return cached
+
+        cos_num = self._cos_num
+        cos_num.value = 0
+        ret = self._pqos_l3ca_get_cos_num(self.p_cap,
+                                          ctypes.byref(cos_num))
         pqos_handle_error('pqos_l3ca_get_cos_num', ret)
+        self._cos_num_cache['l3ca'] = cos_num.value
         return cos_num.value
 
     def get_l2ca_cos_num(self):
@@ -256,14 +477,24 @@ class PqosCap(object):
         Retrieves number of L2 allocation classes of service from
         a cap structure.
 
+        The result is cached: it can go stale when the allocation
+        configuration is reset, call refresh() to force a new query.
+
         Returns:
             a number of L2 allocation classes
         """
 
-        cos_num = ctypes.c_uint(0)
-        ret = self.pqos.lib.pqos_l2ca_get_cos_num(self.p_cap,
-                                                  ctypes.byref(cos_num))
+        cached = self._cos_num_cache.get('l2ca')
+
+        if cached is not None:
+            return cached
+
+        cos_num = self._cos_num
+        cos_num.value = 0
+        ret = self._pqos_l2ca_get_cos_num(self.p_cap,
+                                          ctypes.byref(cos_num))
         pqos_handle_error('pqos_l2ca_get_cos_num', ret)
+        self._cos_num_cache['l2ca'] = cos_num.value
         return cos_num.value
 
     def get_mba_cos_num(self):
@@ -271,66 +502,112 @@ class PqosCap(object):
         Retrieves number of memory B/W allocation classes of service from
         a cap structure.
 
+        The result is cached: it can go stale when the allocation
+        configuration is reset, call refresh() to force a new query.
+
         Returns:
             a number of memory B/W allocation classes
         """
 
-        cos_num = ctypes.c_uint(0)
-        ret = self.pqos.lib.pqos_mba_get_cos_num(self.p_cap,
-                                                 ctypes.byref(cos_num))
+        cached = self._cos_num_cache.get('mba')
+
+        if cached is not None:
+            return cached
+
+        cos_num = self._cos_num
+        cos_num.value = 0
+        ret = self._pqos_mba_get_cos_num(self.p_cap,
+                                         ctypes.byref(cos_num))
         pqos_handle_error('pqos_mba_get_cos_num', ret)
+        self._cos_num_cache['mba'] = cos_num.value
         return cos_num.value
 
     def is_l3ca_cdp_enabled(self):
         """
         Retrieves L3 CDP status.
 
+        The result is cached: it can go stale when the allocation
+        configuration is reset, call refresh() to force a new query.
+
         Returns:
             a tuple of two values: supported (True, False or None)
               and enabled (True, False or None)
         """
 
-        supported = ctypes.c_int(0)
-        enabled = ctypes.c_int(0)
-        ret = self.pqos.lib.pqos_l3ca_cdp_enabled(self.p_cap,
-                                                  ctypes.byref(supported),
-                                                  ctypes.byref(enabled))
+        status = self._status_cache.get('l3ca_cdp')
+
+        if status is not None:
+            return status
+
+        supported = self._supported
+        enabled = self._enabled
+        supported.value = 0
+        enabled.value = 0
+        ret = self._pqos_l3ca_cdp_enabled(self.p_cap,
+                                          ctypes.byref(supported),
+                                          ctypes.byref(enabled))
         pqos_handle_error('pqos_l3ca_cdp_enabled', ret)
-        return (_get_tristate_bool(supported.value),
-                _get_tristate_bool(enabled.value))
+        tristate = _get_tristate_bool
+        status = CdpStatus(tristate(supported.value), tristate(enabled.value))
+        self._status_cache['l3ca_cdp'] = status
+        return status
 
     def is_l2ca_cdp_enabled(self):
         """
         Retrieves L2 CDP status.
 
+        The result is cached: it can go stale when the allocation
+        configuration is reset, call refresh() to force a new query.
+
         Returns:
             a tuple of two values: supported (True, False or None)
               and enabled (True, False or None)
         """
 
-        supported = ctypes.c_int(0)
-        enabled = ctypes.c_int(0)
-        ret = self.pqos.lib.pqos_l2ca_cdp_enabled(self.p_cap,
-                                                  ctypes.byref(supported),
-                                                  ctypes.byref(enabled))
+        status = self._status_cache.get('l2ca_cdp')
+
+        if status is not None:
+            return status
+
+        supported = self._supported
+        enabled = self._enabled
+        supported.value = 0
+        enabled.value = 0
+        ret = self._pqos_l2ca_cdp_enabled(self.p_cap,
+                                          ctypes.byref(supported),
+                                          ctypes.byref(enabled))
         pqos_handle_error('pqos_l2ca_cdp_enabled', ret)
-        return (_get_tristate_bool(supported.value),
-                _get_tristate_bool(enabled.value))
+        tristate = _get_tristate_bool
+        status = CdpStatus(tristate(supported.value), tristate(enabled.value))
+        self._status_cache['l2ca_cdp'] = status
+        return status
 
     def is_mba_ctrl_enabled(self):
         """
         Retrieves MBA CTRL status.
 
+        The result is cached: it can go stale when the allocation
+        configuration is reset, call refresh() to force a new query.
+
         Returns:
             a tuple of two values: supported (True, False or None)
               and enabled (True, False or None)
         """
 
-        supported = ctypes.c_int(0)
-        enabled = ctypes.c_int(0)
-        ret = self.pqos.lib.pqos_mba_ctrl_enabled(self.p_cap,
-                                                  ctypes.byref(supported),
-                                                  ctypes.byref(enabled))
+        status = self._status_cache.get('mba_ctrl')
+
+        if status is not None:
+            return status
+
+        supported = self._supported
+        enabled = self._enabled
+        supported.value = 0
+        enabled.value = 0
+        ret = self._pqos_mba_ctrl_enabled(self.p_cap,
+                                          ctypes.byref(supported),
+                                          ctypes.byref(enabled))
         pqos_handle_error('pqos_mba_ctrl_enabled', ret)
-        return (_get_tristate_bool(supported.value),
-                _get_tristate_bool(enabled.value))
+        tristate = _get_tristate_bool
+        status = CdpStatus(tristate(supported.value), tristate(enabled.value))
+        self._status_cache['mba_ctrl'] = status
+        return status
@@ -85,7 +85,11 @@ class Pqos(object):
     def __init__(self):
         "Finds PQoS library and constructs a new object."
 
-        self.lib = ctypes.cdll.LoadLibrary('libpqos.so.4')
+        # Pqos is a singleton and __init__ runs on every Pqos() call,
+        # so load the library only the first time around to avoid
+        # a dlopen/symbol lookup per construction
+        if getattr(self, 'lib', None) is None:
+            self.lib = ctypes.cdll.LoadLibrary('libpqos.so.4')
 
     def init(self, interface, log_file=None, log_callback=None,
              log_context=None, verbose='default'):
@@ -308,6 +308,121 @@ class TestPqosCap(unittest.TestCase):
         self.assertEqual(mba_capability.ctrl, True)
         self.assertEqual(mba_capability.ctrl_on, False)
 
+    @patch('pqos.capability.Pqos')
+    def test_get_type_mon(self, pqos_mock_cls):
+        "Tests get_type() method for monitoring."
+
+        mon_mem_size = ctypes.sizeof(CPqosCapabilityMonitoring)
+        buf_size = mon_mem_size + 2 * ctypes.sizeof(CPqosMonitor)
+        buf = (ctypes.c_char * buf_size)()
+        mon = CPqosCapabilityMonitoring.from_buffer(buf)
+        mon.mem_size = buf_size
+        mon.max_rmid = 255
+        mon.l3_size = 4 * 1024 * 1024
+        mon.num_events = 2
+        events = (CPqosMonitor * 2).from_buffer(buf, mon_mem_size)
+        events[0].type = CPqosMonitor.PQOS_MON_EVENT_L3_OCCUP
+        events[1].type = CPqosMonitor.PQOS_MON_EVENT_LMEM_BW
+
+        mon_u = CPqosCapabilityUnion(mon=ctypes.pointer(mon))
+        mon_cap = CPqosCapability(type=CPqosCapability.PQOS_CAP_TYPE_MON,
+                                  u=mon_u)
+
+        lib = pqos_mock_cls.return_value.lib
+        _prepare_get_type(lib, mon_cap)
+
+        pqos_cap = PqosCap()
+        mon_capability = pqos_cap.get_type('mon')
+
+        self.assertEqual(mon_capability.max_rmid, 255)
+        self.assertEqual(mon_capability.l3_size, 4 * 1024 * 1024)
+
+        event_types = [event.type for event in mon_capability.events]
+        self.assertEqual(event_types, [CPqosMonitor.PQOS_MON_EVENT_L3_OCCUP,
+                                       CPqosMonitor.PQOS_MON_EVENT_LMEM_BW])
+        self.assertIs(mon_capability.events, mon_capability.events)
+
+    @patch('pqos.capability.Pqos')
+    def test_get_type_cached(self, pqos_mock_cls):
+        "Tests that get_type() caches its result until refresh() is called."
+
+        l3ca = CPqosCapabilityL3(mem_size=ctypes.sizeof(CPqosCapabilityL3),
+                                 num_classes=2, num_ways=8, way_size=1024*1024,
+                                 way_contention=0, cdp=1, cdp_on=0)
+        l3ca_u = CPqosCapabilityUnion(l3ca=ctypes.pointer(l3ca))
+        l3ca_cap = CPqosCapability(type=CPqosCapability.PQOS_CAP_TYPE_L3CA,
+                                   u=l3ca_u)
+
+        lib = pqos_mock_cls.return_value.lib
+        _prepare_get_type(lib, l3ca_cap)
+
+        pqos_cap = PqosCap()
+        l3ca_capability = pqos_cap.get_type('l3ca')
+        l3ca_capability2 = pqos_cap.get_type('l3ca')
+
+        self.assertIs(l3ca_capability, l3ca_capability2)
+        lib.pqos_cap_get_type.assert_called_once()
+
+        pqos_cap.refresh()
+        pqos_cap.get_type('l3ca')
+
+        self.assertEqual(lib.pqos_cap_get_type.call_count, 2)
+
+    @patch('pqos.capability.Pqos')
+    def test_get_l3ca_cos_num_cached(self, pqos_mock_cls):
+        "Tests that get_l3ca_cos_num() caches its result until refresh()."
+
+        state = {'cos_num': 3}
+
+        def pqos_l3ca_cos_num_m(_cap_ref, cos_num_ref):
+            "Mock pqos_l3ca_cos_num()."
+
+            ctypes_ref_set_int(cos_num_ref, state['cos_num'])
+            return 0
+
+        lib = pqos_mock_cls.return_value.lib
+        lib.pqos_cap_get = MagicMock(return_value=0)
+        lib.pqos_l3ca_get_cos_num = MagicMock(side_effect=pqos_l3ca_cos_num_m)
+
+        pqos_cap = PqosCap()
+        self.assertEqual(pqos_cap.get_l3ca_cos_num(), 3)
+
+        state['cos_num'] = 6
+        self.assertEqual(pqos_cap.get_l3ca_cos_num(), 3)
+        lib.pqos_l3ca_get_cos_num.assert_called_once()
+
+        pqos_cap.refresh()
+        self.assertEqual(pqos_cap.get_l3ca_cos_num(), 6)
+        self.assertEqual(lib.pqos_l3ca_get_cos_num.call_count, 2)
+
+    @patch('pqos.capability.Pqos')
+    def test_is_l3ca_cdp_enabled_cached(self, pqos_mock_cls):
+        "Tests that refresh() drops cached L3 CDP status."
+
+        state = {'enabled': 0}
+
+        def pqos_l3cdp_enabled_m(_cap_ref, supported_ref, enabled_ref):
+            "Mock pqos_l3ca_cdp_enabled()."
+
+            ctypes_ref_set_int(supported_ref, 1)
+            ctypes_ref_set_int(enabled_ref, state['enabled'])
+            return 0
+
+        lib = pqos_mock_cls.return_value.lib
+        lib.pqos_cap_get = MagicMock(return_value=0)
+        lib.pqos_l3ca_cdp_enabled = MagicMock(side_effect=pqos_l3cdp_enabled_m)
+
+        pqos_cap = PqosCap()
+        self.assertEqual(pqos_cap.is_l3ca_cdp_enabled(), (True, False))
+
+        state['enabled'] = 1
+        self.assertEqual(pqos_cap.is_l3ca_cdp_enabled(), (True, False))
+        lib.pqos_l3ca_cdp_enabled.assert_called_once()
+
+        pqos_cap.refresh()
+        self.assertEqual(pqos_cap.is_l3ca_cdp_enabled(), (True, True))
+        self.assertEqual(lib.pqos_l3ca_cdp_enabled.call_count, 2)
+
     @patch('pqos.capability.Pqos')
     def test_get_l3ca_cos_num(self, pqos_mock_cls):
         "Tests get_l3ca_cos_num() method."